@@ -192,7 +192,15 @@ class MoonrakerClient:
             self._logger.error('The websocket connection is none?')
 
     async def _process_message(self, message: typing.Data) -> None:
-        response: Dict[str, Any] = json.loads(message)
+        parsed = json.loads(message)
+        # Moonraker answers JSON-RPC batch requests with a single JSON array.
+        if isinstance(parsed, list):
+            for response in parsed:
+                self._process_response(response)
+        else:
+            self._process_response(parsed)
+
+    def _process_response(self, response: Dict[str, Any]) -> None:
         mid = response.get("id")
         if "error" in response and "message" in response["error"]:
             self._logger.warning(
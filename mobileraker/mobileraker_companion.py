@@ -638,7 +638,8 @@ class MobilerakerCompanion:
         try:
             if dtos:
                 request = FcmRequestDto(dtos)
-                response = self._fcm_client.push(request)
+                # The push is a blocking HTTP call, keep it off the event loop
+                response = await self.loop.run_in_executor(None, self._fcm_client.push, request)
             # todo: remove faulty token lol
         except requests.exceptions.RequestException as err:
             self._logger.error(
@@ -761,7 +762,7 @@ class MobilerakerCompanion:
                 self._logger.warning("No snapshot client found for webcam: %s", webcam_key)
                 return None
             # Take a snapshot
-            img_bytes = snapshot_client.capture_snapshot()
+            img_bytes = await self.loop.run_in_executor(None, snapshot_client.capture_snapshot)
             
             if img_bytes:
                 img = base64.b64encode(img_bytes).decode("ascii")
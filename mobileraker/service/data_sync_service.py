@@ -1,5 +1,6 @@
 from asyncio import AbstractEventLoop, sleep
 import asyncio
+import functools
 import hashlib
 import logging
 from typing import Any, Callable, Dict, List, Optional
@@ -85,7 +86,8 @@ class DataSyncService:
         self.timelapse_pause: Optional[bool] = None
         self.filament_sensors: Dict[str, FilamentSensor] = {}
         self.resync_retries: int = retries
-        
+        # Parsers for the raw object keys seen in status updates, filled by _parse_objects
+        self._object_parsers: Dict[str, Callable[[Dict[str, Any]], Optional[bool]]] = {}
 
         self._snapshot_listeners: List[Callable[[PrinterSnapshot], None]] = []
 
@@ -119,53 +121,12 @@ class DataSyncService:
         self._logger.debug("Received status update for %s", status_objects)
         fetchMeta = False
         for rawObjectKey, object_data in status_objects.items():
-            object_identifier, object_name = to_klipper_object_identifier(rawObjectKey)
-
-
-            if object_identifier == 'print_stats':
-                self.print_stats = self.print_stats.updateWith(object_data)
-            
-                # If the state is printing and _reset_timelapse_pause is True, we reset the timelapse_pause attribute
-                if self.print_stats.state != 'paused' and self._reset_timelapse_pause:
-                    self.timelapse_pause = False
-                    self._reset_timelapse_pause = False
-                    self._logger.info("Printer has unpaused after Timelapse plugin took frame. Resetting timelapse_pause attribute.")
-
-                # When the print_stats object is updated, we need to fetch the metadata for the current file
+            parser = self._object_parsers.get(rawObjectKey)
+            if parser is None:
+                parser = self._resolve_object_parser(rawObjectKey)
+                self._object_parsers[rawObjectKey] = parser
+            if parser(object_data):
                 fetchMeta = True
-            elif object_identifier == 'display_status':
-                self.display_status = self.display_status.updateWith(
-                    object_data)
-            elif object_identifier == 'virtual_sdcard':
-                self.virtual_sdcard = self.virtual_sdcard.updateWith(
-                    object_data)
-            elif object_identifier == 'toolhead':
-                self.toolhead = self.toolhead.updateWith(object_data)
-            elif object_identifier == 'gcode_move':
-                self.gcode_move = self.gcode_move.updateWith(object_data)
-            elif object_identifier == 'filament_switch_sensor' or object_identifier == 'filament_motion_sensor':
-                if object_name is None:
-                    self._logger.warning("Received filament sensor object without name. Skipping...")
-                    continue
-                
-                #check if the sensor is already in the list, if not create a default one and call updateWith
-                sensor = self.filament_sensors[object_name] if object_name in self.filament_sensors else FilamentSensor(name= object_name, kind = object_identifier)
-                self.filament_sensors[object_name] = sensor.updateWith(object_data)
-
-            elif rawObjectKey == 'gcode_macro TIMELAPSE_TAKE_FRAME':
-                if 'is_paused' in object_data:
-                    is_paused = object_data['is_paused']
-                    if is_paused is True:
-                        self.timelapse_pause = True
-                        self._reset_timelapse_pause = False
-                        self._logger.info("Timelapse plugin has paused the printer. Ignoring the next paused printer state.")
-                    elif is_paused is False and self._reset_timelapse_pause is False:
-                        # We need to use a helper attribute to reset the timelapse_pause attribute after the printer switched back from paused to printing
-                        # This is because the printer state is not (always) updated in the same jrpc notification as the gcode_macro TIMELAPSE_TAKE_FRAME
-                        # Which causes a race condition where the timelapse_pause attribute is reset before the printer state is updated.
-                        self._reset_timelapse_pause = True
-                        self._logger.info("Timelapse plugin took frame. Will reset timelapse_pause attribute after printer-state change.")
-                
 
         # Kinda hacky but this works!
         # It would be better if the _notify_listeners()/sync current file is called in a different context since this method should only parse!
@@ -174,6 +135,88 @@ class DataSyncService:
         else:
             self._notify_listeners()
 
+    def _resolve_object_parser(self, rawObjectKey: str) -> Callable[[Dict[str, Any]], Optional[bool]]:
+        '''
+        Resolve the parser for a raw klipper object key.
+
+        Status updates repeat the same few keys many times per second, so the key is only split and
+        matched once and _parse_objects caches the resulting handler.
+
+        Parameters:
+            rawObjectKey (str): The key as sent by Moonraker, e.g. "filament_switch_sensor runout".
+
+        Returns:
+            Callable[[Dict[str, Any]], Optional[bool]]: Handler for the object data, returning True if the
+            metadata of the current file has to be fetched.
+        '''
+        object_identifier, object_name = to_klipper_object_identifier(rawObjectKey)
+
+        if object_identifier == 'print_stats':
+            return self._parse_print_stats
+        elif object_identifier == 'display_status':
+            return self._parse_display_status
+        elif object_identifier == 'virtual_sdcard':
+            return self._parse_virtual_sdcard
+        elif object_identifier == 'toolhead':
+            return self._parse_toolhead
+        elif object_identifier == 'gcode_move':
+            return self._parse_gcode_move
+        elif object_identifier == 'filament_switch_sensor' or object_identifier == 'filament_motion_sensor':
+            return functools.partial(self._parse_filament_sensor, object_identifier, object_name)
+        elif rawObjectKey == 'gcode_macro TIMELAPSE_TAKE_FRAME':
+            return self._parse_timelapse_take_frame
+        return self._ignore_object
+
+    def _parse_print_stats(self, object_data: Dict[str, Any]) -> bool:
+        self.print_stats = self.print_stats.updateWith(object_data)
+
+        # If the state is printing and _reset_timelapse_pause is True, we reset the timelapse_pause attribute
+        if self.print_stats.state != 'paused' and self._reset_timelapse_pause:
+            self.timelapse_pause = False
+            self._reset_timelapse_pause = False
+            self._logger.info("Printer has unpaused after Timelapse plugin took frame. Resetting timelapse_pause attribute.")
+
+        # When the print_stats object is updated, we need to fetch the metadata for the current file
+        return True
+
+    def _parse_display_status(self, object_data: Dict[str, Any]) -> None:
+        self.display_status = self.display_status.updateWith(object_data)
+
+    def _parse_virtual_sdcard(self, object_data: Dict[str, Any]) -> None:
+        self.virtual_sdcard = self.virtual_sdcard.updateWith(object_data)
+
+    def _parse_toolhead(self, object_data: Dict[str, Any]) -> None:
+        self.toolhead = self.toolhead.updateWith(object_data)
+
+    def _parse_gcode_move(self, object_data: Dict[str, Any]) -> None:
+        self.gcode_move = self.gcode_move.updateWith(object_data)
+
+    def _parse_filament_sensor(self, object_identifier: str, object_name: Optional[str], object_data: Dict[str, Any]) -> None:
+        if object_name is None:
+            self._logger.warning("Received filament sensor object without name. Skipping...")
+            return
+
+        #check if the sensor is already in the list, if not create a default one and call updateWith
+        sensor = self.filament_sensors[object_name] if object_name in self.filament_sensors else FilamentSensor(name= object_name, kind = object_identifier)
+        self.filament_sensors[object_name] = sensor.updateWith(object_data)
+
+    def _parse_timelapse_take_frame(self, object_data: Dict[str, Any]) -> None:
+        if 'is_paused' in object_data:
+            is_paused = object_data['is_paused']
+            if is_paused is True:
+                self.timelapse_pause = True
+                self._reset_timelapse_pause = False
+                self._logger.info("Timelapse plugin has paused the printer. Ignoring the next paused printer state.")
+            elif is_paused is False and self._reset_timelapse_pause is False:
+                # We need to use a helper attribute to reset the timelapse_pause attribute after the printer switched back from paused to printing
+                # This is because the printer state is not (always) updated in the same jrpc notification as the gcode_macro TIMELAPSE_TAKE_FRAME
+                # Which causes a race condition where the timelapse_pause attribute is reset before the printer state is updated.
+                self._reset_timelapse_pause = True
+                self._logger.info("Timelapse plugin took frame. Will reset timelapse_pause attribute after printer-state change.")
+
+    def _ignore_object(self, object_data: Dict[str, Any]) -> None:
+        pass
+
     def _on_klippy_ready(self) -> None:
         '''
         Handle the Klippy ready event.
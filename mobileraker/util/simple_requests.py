@@ -8,28 +8,50 @@ third-party python packages is not possible.
 Only the following pieces of functionality are supported:
 
 ``get`` and ``post`` helpers returning a :class:`Response` object with
-``status_code``, ``content``, ``text`` and ``json`` helpers as well as a
-``raise_for_status`` method.  The ``json=`` argument for ``post`` is
-supported, and the ``timeout`` argument is honoured for both helpers.
+``status_code``, ``ok``, ``content``, ``text`` and ``json`` helpers as well as
+a ``raise_for_status`` method.  The ``json=`` argument for ``post`` is
+supported, and the ``timeout`` argument is honoured for both helpers.  JSON
+is handled by :mod:`orjson` when it is installed and by the standard library
+:mod:`json` module otherwise.
 
 Error handling mimics the relevant pieces of the requests exception hierarchy
 that the project relies on.  We expose ``exceptions`` with ``RequestException``
 and the common subclasses ``Timeout`` and ``ConnectionError``.  All network
 related errors raise one of those exceptions.
 
-The implementation uses :mod:`urllib` from the Python standard library and is
+The implementation uses :mod:`http.client` from the Python standard library
+and keeps one persistent HTTP/1.1 connection per ``(scheme, host, port)`` so
+repeated requests to the same host reuse the socket instead of paying a new
+TCP (and TLS) handshake each time.  Call :func:`close_all` to drop the pooled
+connections on shutdown.  Unlike ``urlopen`` the ``*_proxy`` environment
+variables are not honoured; requests always go directly to the host.  It is
 careful to keep the interface compact so it remains easy to maintain.
 """
 
 from __future__ import annotations
 
+import functools
+import http.client
+import io
 import json
 import socket
-from dataclasses import dataclass
+import ssl
+import sys
+import threading
+from dataclasses import dataclass, field
 from types import SimpleNamespace
-from typing import Any, Dict, Optional
-from urllib import error as urllib_error
-from urllib import request as urllib_request
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urljoin, urlsplit
+
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+try:
+    import ijson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    ijson = None  # type: ignore
 
 
 class RequestException(Exception):
@@ -48,6 +70,19 @@ class HTTPError(RequestException):
     """Raised when the server returns an error response (status >= 400)."""
 
 
+def _timeout_error(reason: object) -> Timeout:
+    """Build a :class:`Timeout` the way ``raise Timeout(...) from None`` would.
+
+    The exception is created without running ``__init__`` and with its
+    context already suppressed.
+    """
+
+    exc = Timeout.__new__(Timeout)
+    exc.args = (str(reason),)
+    exc.__suppress_context__ = True
+    return exc
+
+
 exceptions = SimpleNamespace(
     RequestException=RequestException,
     Timeout=Timeout,
@@ -56,107 +91,547 @@ exceptions = SimpleNamespace(
 )
 
 
-@dataclass
+_ERROR_SNIPPET_BYTES = 512
+
+
 class Response:
-    """Simplified response object returned by :func:`get` and :func:`post`."""
+    """Simplified response object returned by :func:`get` and :func:`post`.
 
-    status_code: int
-    headers: Dict[str, str]
-    content: bytes
+    A plain ``__slots__`` class, so instances carry no per-object
+    ``__dict__``.
+
+    Responses of ``get(..., stream=True)`` keep the open HTTP response and only
+    read the body when :attr:`content` is accessed, or chunk by chunk through
+    :meth:`iter_content` and :meth:`json_streaming`.
+    """
+
+    __slots__ = ("status_code", "headers", "ok", "_content", "_text", "_raw", "_conn")
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: http.client.HTTPMessage,
+        content: Optional[bytes],
+        raw: Optional[http.client.HTTPResponse] = None,
+        conn: Optional[http.client.HTTPConnection] = None,
+    ) -> None:
+        self.status_code = status_code
+        # The parsed ``http.client.HTTPMessage`` is handed through untouched.
+        # Lookups are case-insensitive, but unlike a dict a missing header
+        # gives ``None`` rather than ``KeyError`` and a repeated header gives
+        # its first value.
+        self.headers = headers
+        # Computed once so callers can test ``ok`` before paying for a call to
+        # :meth:`raise_for_status` on the common success path.
+        self.ok = status_code < 400
+        self._content = content
+        self._text: Optional[str] = None
+        self._raw = raw
+        self._conn = conn
+
+    def __repr__(self) -> str:
+        return f"<Response [{self.status_code}]>"
+
+    @property
+    def content(self) -> bytes:
+        if self._content is None:
+            if self._raw is None:
+                raise RuntimeError("The content for this response was already consumed")
+            try:
+                self._content = _read_stream(self._raw, None)
+            finally:
+                self.close()
+        return self._content
+
+    def iter_content(self, chunk_size: int = io.DEFAULT_BUFFER_SIZE) -> Iterator[bytes]:
+        """Yield the body in chunks of at most *chunk_size* bytes.
+
+        For streamed responses the body is read from the socket as it is
+        consumed and never held in memory as a whole.
+        """
+
+        if self._content is not None:
+            for start in range(0, len(self._content), chunk_size):
+                yield self._content[start:start + chunk_size]
+            return
+        if self._raw is None:
+            raise RuntimeError("The content for this response was already consumed")
+        try:
+            while True:
+                chunk = _read_stream(self._raw, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            self.close()
+
+    def json_streaming(self, prefix: str) -> Iterator[Any]:
+        """Yield the JSON values found at *prefix*, using ``ijson`` syntax.
+
+        With :mod:`ijson` installed a streamed body is parsed incrementally, so
+        e.g. ``"result.item"`` walks a large result array without building it.
+        Otherwise the body is parsed in full and the same values are yielded;
+        in both cases non-integer numbers come back as ``float``.
+        """
+
+        if ijson is not None and self._content is None and self._raw is not None:
+            try:
+                yield from ijson.items(_StreamReader(self._raw), prefix, use_float=True)
+            finally:
+                self.close()
+            return
+        yield from _iter_json_prefix(self.json(), prefix.split(".") if prefix else [])
+
+    def close(self) -> None:
+        """Release the connection held by a streamed response."""
+
+        raw, conn = self._raw, self._conn
+        self._raw = self._conn = None
+        if raw is not None:
+            raw.close()
+        if conn is not None:
+            conn.close()
 
     def raise_for_status(self) -> None:
         """Raise :class:`HTTPError` when the response indicates a failure."""
 
-        if 400 <= self.status_code:
-            raise HTTPError(f"HTTP {self.status_code}: {self.text}")
+        if not self.ok:
+            # Only the start of the body is useful in the message, so avoid
+            # decoding a potentially large error page in full.
+            snippet = self.content[:_ERROR_SNIPPET_BYTES].decode("utf-8", errors="replace")
+            raise HTTPError(f"HTTP {self.status_code}: {snippet}")
 
     @property
     def text(self) -> str:
-        return self.content.decode("utf-8", errors="replace")
+        if self._text is None:
+            self._text = self.content.decode("utf-8", errors="replace")
+        return self._text
+
+    def text_strict(self) -> str:
+        """Decode the body as strict UTF-8.
+
+        Raises :class:`UnicodeDecodeError` for invalid input instead of
+        replacing it.  A successful decode also backs :attr:`text`, as valid
+        UTF-8 decodes to the same string either way.
+        """
+
+        text = self.content.decode("utf-8")
+        self._text = text
+        return text
 
     def json(self) -> Any:
-        return json.loads(self.text)
+        # orjson parses the raw bytes directly.  JSON has to be UTF-8, so the
+        # stdlib fallback decodes strictly instead of sniffing the encoding,
+        # and leaves the string cached for :attr:`text`.
+        if orjson is not None:
+            return orjson.loads(self.content)
+        return json.loads(self.text_strict())
 
 
-def _build_request(
-    url: str,
-    data: Optional[bytes] = None,
-    headers: Optional[Dict[str, str]] = None,
-) -> urllib_request.Request:
-    req = urllib_request.Request(url, data=data)
-    if headers:
-        for key, value in headers.items():
-            req.add_header(key, value)
-    return req
+def _read_stream(raw: http.client.HTTPResponse, amt: Optional[int]) -> bytes:
+    try:
+        return raw.read(amt)
+    except (socket.timeout, TimeoutError) as err:
+        raise _timeout_error(err)
+    except (OSError, http.client.HTTPException) as err:
+        raise ConnectionError(str(err)) from None
+
+
+class _StreamReader:
+    """File-like view of a streamed body for :mod:`ijson`.
+
+    Reads go through :func:`_read_stream` so network errors raised mid-parse
+    surface as :class:`RequestException` subclasses.
+    """
+
+    __slots__ = ("_raw",)
+
+    def __init__(self, raw: http.client.HTTPResponse) -> None:
+        self._raw = raw
+
+    def read(self, amt: int = -1) -> bytes:
+        return _read_stream(self._raw, None if amt is None or amt < 0 else amt)
+
+
+def _iter_json_prefix(value: Any, parts: List[str]) -> Iterator[Any]:
+    # Mirrors ijson prefixes: ``item`` selects every array element, any other
+    # part selects a key of an object.
+    if not parts:
+        yield value
+        return
+    head, rest = parts[0], parts[1:]
+    if isinstance(value, list) and head == "item":
+        for element in value:
+            yield from _iter_json_prefix(element, rest)
+    elif isinstance(value, dict) and head in value:
+        yield from _iter_json_prefix(value[head], rest)
+
+
+_PoolKey = Tuple[str, str, int]
+# Headers travel internally as ``(name, value)`` pairs; the public ``Dict``
+# arguments are converted once by :func:`_header_pairs`.
+_HeaderPairs = Sequence[Tuple[str, str]]
+# Request bodies may be any contiguous byte buffer; they are sent without copying.
+_Body = Union[bytes, bytearray, memoryview]
+
+_JSON_HEADERS: _HeaderPairs = (("Content-Type", "application/json"),)
+# Sent unless the caller supplies one, matching what ``urlopen`` announced.
+_USER_AGENT = "Python-urllib/%d.%d" % sys.version_info[:2]
+# Methods for which http.client announces an empty body explicitly.
+_BODY_METHODS = frozenset(("POST", "PUT", "PATCH"))
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+_MAX_REDIRECTS = 10
+# Unused bodies up to this size are drained to keep the connection alive.
+_DISCARD_DRAIN_BYTES = 64 * 1024
+# Errors raised when the server silently dropped an idle keep-alive socket.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+@dataclass
+class _PoolEntry:
+    """A persistent connection plus the lock serialising its use."""
+
+    conn: http.client.HTTPConnection
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+_pool: Dict[_PoolKey, _PoolEntry] = {}
+_pool_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=32)
+def _split_url(url: str) -> Tuple[_PoolKey, str]:
+    """Split *url* into its pool key and request target path.
+
+    The FCM push and webcam snapshot clients each request one fixed URL, so
+    the parsed result is cached instead of running :func:`urlsplit` on every
+    call.
+    """
+
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS:
+        raise RequestException(f"Unsupported URL scheme: {url}")
+    host = parts.hostname
+    if not host:
+        raise RequestException(f"Invalid URL, no host supplied: {url}")
+    port = parts.port or _DEFAULT_PORTS[scheme]
+
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    return (scheme, host, port), path
+
 
+def _get_connection(url: str) -> Tuple[_PoolEntry, str]:
+    """Return the pooled connection for *url* and the request target path."""
 
-def _handle_url_error(err: urllib_error.URLError) -> None:
-    reason = err.reason
-    if isinstance(reason, socket.timeout):
-        raise Timeout(str(reason)) from None
-    raise ConnectionError(str(reason)) from None
+    key, path = _split_url(url)
+    entry = _pool.get(key)
+    if entry is None:
+        with _pool_lock:
+            entry = _pool.get(key)
+            if entry is None:
+                entry = _PoolEntry(_new_connection(key))
+                _pool[key] = entry
+    return entry, path
+
+
+def _new_connection(key: _PoolKey) -> http.client.HTTPConnection:
+    scheme, host, port = key
+    if scheme == "https":
+        return _ResumingHTTPSConnection(host, port)
+    return http.client.HTTPConnection(host, port)
+
+
+# One context for every HTTPS connection: certificates are loaded once and
+# the TLS sessions it hands out can be offered again on reconnect.
+_TLS_CTX = ssl.create_default_context()
+
+
+class _ResumingHTTPSConnection(http.client.HTTPSConnection):
+    """HTTPS connection that resumes its previous TLS session on reconnect.
+
+    Python only attempts resumption when the old session is passed to
+    ``wrap_socket`` explicitly, so it is remembered whenever the socket is
+    closed and offered again on the next connect, turning the reconnect of an
+    idle keep-alive connection into an abbreviated handshake.
+    """
+
+    def __init__(self, host: str, port: int) -> None:
+        super().__init__(host, port, context=_TLS_CTX)
+        self._tls_session: Optional[ssl.SSLSession] = None
+
+    def connect(self) -> None:
+        http.client.HTTPConnection.connect(self)
+        server_hostname = self._tunnel_host or self.host
+        self.sock = self._context.wrap_socket(
+            self.sock, server_hostname=server_hostname, session=self._tls_session
+        )
+
+    def close(self) -> None:
+        # TLS 1.3 tickets arrive after the handshake, so take the session as
+        # late as possible.
+        if isinstance(self.sock, ssl.SSLSocket) and self.sock.session is not None:
+            self._tls_session = self.sock.session
+        super().close()
+
+
+def _set_timeout(conn: http.client.HTTPConnection, timeout: Optional[float]) -> None:
+    # Connections are shared between calls, so apply the per-call timeout to
+    # both future connects and an already open socket.
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+
+
+def _follows_redirect(method: str, status: int, location: Optional[str]) -> bool:
+    # Follow redirects the same way ``urllib`` did: GETs follow every
+    # redirect, POSTs only 301/302/303 and are turned into GETs.
+    if not location or status not in _REDIRECT_CODES:
+        return False
+    return method != "POST" or status in (301, 302, 303)
+
+
+def _read_body(
+    conn: http.client.HTTPConnection, res: http.client.HTTPResponse, method: str
+) -> bytes:
+    """Read the body of *res*, skipping what nobody is going to look at.
+
+    A plain ``read()`` is already sized from ``Content-Length`` (or joins the
+    chunks once) by :mod:`http.client`.  Bodies of followed redirects and error
+    responses are never handed to the caller, so only a bounded prefix is read;
+    when more is left the socket is dropped instead of draining it.
+    """
+
+    status = res.status
+    if status >= 400:
+        limit = _ERROR_SNIPPET_BYTES
+    elif _follows_redirect(method, status, res.getheader("Location")):
+        limit = _DISCARD_DRAIN_BYTES
+    else:
+        return res.read()
+
+    head = res.read(limit)
+    if not res.isclosed():
+        conn.close()
+    return head
+
+
+def _send_request(
+    conn: http.client.HTTPConnection,
+    method: str,
+    path: str,
+    body: Optional[_Body],
+    headers: _HeaderPairs,
+) -> None:
+    """Write a request to *conn* straight from ``(name, value)`` pairs.
+
+    Mirrors :meth:`http.client.HTTPConnection.request` without requiring the
+    headers to be collected into a dict first.
+    """
+
+    names = {name.lower() for name, _ in headers}
+    conn.putrequest(
+        method,
+        path,
+        skip_host="host" in names,
+        skip_accept_encoding="accept-encoding" in names,
+    )
+    if "user-agent" not in names:
+        conn.putheader("User-Agent", _USER_AGENT)
+    for name, value in headers:
+        conn.putheader(name, value)
+    if "content-length" not in names:
+        if body is not None:
+            size = body.nbytes if isinstance(body, memoryview) else len(body)
+            conn.putheader("Content-Length", str(size))
+        elif method in _BODY_METHODS:
+            conn.putheader("Content-Length", "0")
+    conn.endheaders(body)
+
+
+def _request_once(
+    method: str,
+    url: str,
+    body: Optional[_Body],
+    headers: _HeaderPairs,
+    timeout: Optional[float],
+) -> Tuple[http.client.HTTPResponse, bytes]:
+    entry, path = _get_connection(url)
+    with entry.lock:
+        conn = entry.conn
+        while True:
+            reused = conn.sock is not None
+            try:
+                _set_timeout(conn, timeout)
+                _send_request(conn, method, path, body, headers)
+                res = conn.getresponse()
+                content = _read_body(conn, res, method)
+                break
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                # Only a socket kept from an earlier request can have gone
+                # stale while idle.  On a fresh connection the request may
+                # already have reached the server, so it is not sent twice.
+                if not reused:
+                    raise
+            except BaseException:
+                # Leave no half-finished exchange on the shared connection.
+                conn.close()
+                raise
+        return res, content
+
+
+def _open_stream(
+    method: str,
+    url: str,
+    body: Optional[_Body],
+    headers: _HeaderPairs,
+    timeout: Optional[float],
+) -> Tuple[http.client.HTTPResponse, Optional[bytes], Optional[http.client.HTTPConnection]]:
+    # A streamed body can stay unread for as long as the caller likes, so it
+    # gets a connection of its own instead of blocking the pooled one.
+    key, path = _split_url(url)
+    conn = _new_connection(key)
+    try:
+        _set_timeout(conn, timeout)
+        _send_request(conn, method, path, body, headers)
+        res = conn.getresponse()
+        if res.status < 400 and not _follows_redirect(method, res.status, res.getheader("Location")):
+            return res, None, conn
+        content = _read_body(conn, res, method)
+    except BaseException:
+        conn.close()
+        raise
+    conn.close()
+    return res, content, None
 
 
 def _execute_request(
-    req: urllib_request.Request, timeout: Optional[float]
+    method: str,
+    url: str,
+    body: Optional[_Body],
+    headers: _HeaderPairs,
+    timeout: Optional[float],
+    stream: bool = False,
 ) -> Response:
+    stream_conn: Optional[http.client.HTTPConnection] = None
     try:
-        with urllib_request.urlopen(req, timeout=timeout) as res:  # nosec B310
-            content = res.read()
-            headers = {k: v for k, v in res.headers.items()}
-            return Response(status_code=res.getcode(), headers=headers, content=content)
-    except urllib_error.HTTPError as err:
-        response = Response(
-            status_code=err.code,
-            headers=dict(err.headers.items()) if err.headers else {},
-            content=err.read(),
-        )
+        for _ in range(_MAX_REDIRECTS + 1):
+            if stream:
+                res, content, stream_conn = _open_stream(method, url, body, headers, timeout)
+            else:
+                res, content = _request_once(method, url, body, headers, timeout)
+            location = res.getheader("Location")
+            if not _follows_redirect(method, res.status, location):
+                break
+            if method == "POST":
+                method, body = "GET", None
+                headers = [(k, v) for k, v in headers if k.lower() != "content-type"]
+            url = urljoin(url, location)
+        else:
+            raise RequestException(f"Exceeded {_MAX_REDIRECTS} redirects")
+    # Checked first as timeouts are the common failure; before Python 3.10
+    # ``socket.timeout`` and the OS-level ``TimeoutError`` were distinct.
+    except (socket.timeout, TimeoutError) as err:
+        raise _timeout_error(err)
+    except (OSError, http.client.HTTPException) as err:
+        raise ConnectionError(str(err)) from None
+
+    response = Response(
+        status_code=res.status,
+        headers=res.msg,
+        content=content,
+        raw=res if stream_conn is not None else None,
+        conn=stream_conn,
+    )
+    if not response.ok:
         response.raise_for_status()
-        return response
-    except urllib_error.URLError as err:
-        _handle_url_error(err)
-        # ``_handle_url_error`` always raises, but keep ``mypy`` happy.
-        raise ConnectionError(str(err))
-    except socket.timeout as err:
-        raise Timeout(str(err)) from None
+    return response
+
+
+def close_all() -> None:
+    """Close every pooled connection, e.g. when shutting down."""
 
+    with _pool_lock:
+        entries = list(_pool.values())
+        _pool.clear()
+    for entry in entries:
+        with entry.lock:
+            entry.conn.close()
 
-def get(url: str, timeout: Optional[float] = None, headers: Optional[Dict[str, str]] = None) -> Response:
+
+def get(
+    url: str,
+    timeout: Optional[float] = None,
+    headers: Optional[Dict[str, str]] = None,
+    stream: bool = False,
+) -> Response:
     """Perform a HTTP GET request.
 
-    Parameters mirror :func:`requests.get` for the supported arguments.
+    Parameters mirror :func:`requests.get` for the supported arguments.  With
+    ``stream=True`` the body is not read up front; consume it through
+    :meth:`Response.iter_content` or call :meth:`Response.close`.
     """
 
-    req = _build_request(url, headers=headers)
-    return _execute_request(req, timeout)
+    return _execute_request(
+        "GET", url, None, _header_pairs(headers), timeout, stream
+    )
 
 
 def post(
     url: str,
     *,
     json: Optional[Any] = None,
-    data: Optional[bytes] = None,
+    data: Optional[_Body] = None,
     timeout: Optional[float] = None,
     headers: Optional[Dict[str, str]] = None,
 ) -> Response:
     """Perform a HTTP POST request supporting ``json=`` bodies."""
 
-    body: Optional[bytes] = data
-    req_headers: Dict[str, str] = {}
-    if headers:
-        req_headers.update(headers)
+    body, req_headers = _post_body(json, data, headers)
+    return _execute_request("POST", url, body, req_headers, timeout)
+
+
+def _post_body(
+    json: Optional[Any],
+    data: Optional[_Body],
+    headers: Optional[Dict[str, str]],
+) -> Tuple[Optional[_Body], _HeaderPairs]:
+    if data is None and not headers:
+        # Fast paths for the common JSON-RPC style call and for an empty POST,
+        # which goes out with ``Content-Length: 0`` and nothing to merge.
+        if json is not None:
+            return json_dumps(json), _JSON_HEADERS
+        return None, ()
+
+    body: Optional[_Body] = data
+    req_headers = _header_pairs(headers)
 
     if json is not None:
         body = json_dumps(json)
-        req_headers.setdefault("Content-Type", "application/json")
+        if not any(name.lower() == "content-type" for name, _ in req_headers):
+            req_headers += _JSON_HEADERS
+
+    return body, req_headers
+
 
-    req = _build_request(url, data=body, headers=req_headers)
-    return _execute_request(req, timeout)
+def _header_pairs(headers: Optional[Dict[str, str]]) -> _HeaderPairs:
+    return tuple(headers.items()) if headers else ()
 
 
 def json_dumps(payload: Any) -> bytes:
     """Serialise *payload* to JSON bytes using UTF-8 encoding."""
 
+    if orjson is not None:
+        return orjson.dumps(payload)
     return json.dumps(payload).encode("utf-8")
 
 
@@ -166,6 +641,7 @@ __all__ = [
     "RequestException",
     "Response",
     "Timeout",
+    "close_all",
     "exceptions",
     "get",
     "post",
@@ -13,20 +13,26 @@ from mobileraker.data.dtos.moonraker.printer_objects import (
 from mobileraker.service.data_sync_service import DataSyncService
 
 
-class TestDataSyncService(unittest.TestCase):
+class TestDataSyncService(unittest.IsolatedAsyncioTestCase):
 
-    def setUp(self):
-        self.loop = asyncio.get_event_loop()
+    @classmethod
+    def setUpClass(cls):
+        cls.jrpc_new = MagicMock()
+        cls.jrpc_new.send_and_receive_method = AsyncMock(return_value=({"result": {}}, None))
+        cls.jrpc_new.send_method = AsyncMock(return_value=None)
 
+        cls.jrpc_legacy = MagicMock()
+        cls.jrpc_legacy.send_and_receive_method = AsyncMock(return_value=({"result": {}}, None))
+        cls.jrpc_legacy.send_method = AsyncMock(return_value=None)
 
-        self.jrpc_new = MagicMock()
-        self.jrpc_new.send_and_receive_method = AsyncMock(return_value=({"result": {}}, None))
-        self.jrpc_new.send_method = AsyncMock(return_value=None)
+    async def asyncSetUp(self):
+        self.loop = asyncio.get_running_loop()
+
+        # The mocks are shared by all tests, only their recorded state is reset.
+        self.jrpc_new.reset_mock(side_effect=True)
         self.data_sync_service_new = DataSyncService(self.jrpc_new, "Printer", self.loop, 2)
 
-        self.jrpc_legacy = MagicMock()
-        self.jrpc_legacy.send_and_receive_method = AsyncMock(return_value=({"result": {}}, None))
-        self.jrpc_legacy.send_method = AsyncMock(return_value=None)
+        self.jrpc_legacy.reset_mock(side_effect=True)
         self.data_sync_service_legacy = DataSyncService(self.jrpc_legacy, self.loop, 2)
 
     def services(self):
@@ -36,7 +42,7 @@ class TestDataSyncService(unittest.TestCase):
         ]
 
 
-    def test_initialization(self):
+    async def test_initialization(self):
         for name, svc, _ in self.services():
             with self.subTest(signature=name):
                 self.assertFalse(svc.klippy_ready)
@@ -45,13 +51,13 @@ class TestDataSyncService(unittest.TestCase):
                 self.assertIsInstance(svc.display_status, DisplayStatus)
                 self.assertIsInstance(svc.virtual_sdcard, VirtualSDCard)
 
-    def test_legacy_signature_defaults_printer_name(self):
+    async def test_legacy_signature_defaults_printer_name(self):
         self.assertEqual(
             self.data_sync_service_legacy._logger.name,
             "mobileraker._Default.sync",
         )
 
-    def test_parse_objects_with_print_stats(self):
+    async def test_parse_objects_with_print_stats(self):
         status_objects = {
             "print_stats": {"filename": "test.gcode", "state": "printing"}
         }
@@ -61,7 +67,7 @@ class TestDataSyncService(unittest.TestCase):
                 self.assertEqual(svc.print_stats.filename, "test.gcode")
                 self.assertEqual(svc.print_stats.state, "printing")
 
-    def test_parse_objects_with_display_status(self):
+    async def test_parse_objects_with_display_status(self):
         status_objects = {
             "display_status": {"message": "Printing in progress"}
         }
@@ -70,7 +76,7 @@ class TestDataSyncService(unittest.TestCase):
                 svc._parse_objects(status_objects)
                 self.assertEqual(svc.display_status.message, "Printing in progress")
 
-    def test_parse_objects_with_virtual_sdcard(self):
+    async def test_parse_objects_with_virtual_sdcard(self):
         status_objects = {
             "virtual_sdcard": {"progress": 0.5}
         }
@@ -79,7 +85,7 @@ class TestDataSyncService(unittest.TestCase):
                 svc._parse_objects(status_objects)
                 self.assertEqual(svc.virtual_sdcard.progress, 0.5)
 
-    def test_parse_objects_with_all_status_objects(self):
+    async def test_parse_objects_with_all_status_objects(self):
         status_objects = {
             "print_stats": {"filename": "test.gcode", "state": "printing"},
             "display_status": {"message": "Printing in progress"},
@@ -93,7 +99,20 @@ class TestDataSyncService(unittest.TestCase):
                 self.assertEqual(svc.display_status.message, "Printing in progress")
                 self.assertEqual(svc.virtual_sdcard.progress, 0.5)
 
-    def test_parse_objects_with_no_status_objects(self):
+    async def test_parse_objects_with_filament_sensor_and_unknown_object(self):
+        status_objects = {
+            "filament_switch_sensor runout": {"filament_detected": True},
+            "heater_bed": {"temperature": 60.0},
+        }
+        for name, svc, _ in self.services():
+            with self.subTest(signature=name):
+                svc._parse_objects(status_objects)
+                svc._parse_objects({"filament_switch_sensor runout": {"filament_detected": False}})
+                sensor = svc.filament_sensors["runout"]
+                self.assertEqual(sensor.kind, "filament_switch_sensor")
+                self.assertFalse(sensor.filament_detected)
+
+    async def test_parse_objects_with_no_status_objects(self):
         status_objects = {}
         for name, svc, _ in self.services():
             with self.subTest(signature=name):
@@ -103,7 +122,7 @@ class TestDataSyncService(unittest.TestCase):
                 self.assertIsNone(svc.display_status.message)
                 self.assertEqual(svc.virtual_sdcard.progress, 0)
 
-    def test_resync_with_parse_objects(self):
+    async def test_resync_with_parse_objects(self):
         status_objects = {
             "print_stats": {"filename": "test.gcode", "state": "printing"},
             "display_status": {"message": "Printing in progress"},
@@ -125,13 +144,13 @@ class TestDataSyncService(unittest.TestCase):
             jrpc.send_and_receive_method.side_effect = mock_send_and_receive_method
 
             with self.subTest(signature=name):
-                self.loop.run_until_complete(svc.resync())
+                await svc.resync()
                 self.assertEqual(svc.print_stats.filename, "test.gcode")
                 self.assertEqual(svc.print_stats.state, "printing")
                 self.assertEqual(svc.display_status.message, "Printing in progress")
                 self.assertEqual(svc.virtual_sdcard.progress, 0.5)
 
-    def test_resync_klippy_ready(self):
+    async def test_resync_klippy_ready(self):
         for name, svc, jrpc in self.services():
             async def mock_send_and_receive_method(method, params=None):
                 if method == "server.info":
@@ -146,7 +165,7 @@ class TestDataSyncService(unittest.TestCase):
             jrpc.send_and_receive_method.side_effect = mock_send_and_receive_method
 
             with self.subTest(signature=name):
-                self.loop.run_until_complete(svc.resync())
+                await svc.resync()
                 self.assertTrue(svc.klippy_ready)
 
 
@@ -168,7 +187,7 @@ class TestDataSyncService(unittest.TestCase):
     #     self.loop.run_until_complete(self.data_sync_service.resync())
     #     self.assertTrue(self.data_sync_service.klippy_ready)
 
-    def test_resync_klippy_not_ready_timeout(self):
+    async def test_resync_klippy_not_ready_timeout(self):
         for name, svc, jrpc in self.services():
             async def mock_send_and_receive_method(method, params=None):
                 if method == "server.info":
@@ -178,7 +197,7 @@ class TestDataSyncService(unittest.TestCase):
 
             with self.subTest(signature=name):
                 with self.assertRaises(TimeoutError):
-                    self.loop.run_until_complete(svc.resync())
+                    await svc.resync()
 
     # Add more test cases for other methods as needed
 
@@ -0,0 +1,42 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from mobileraker.mobileraker_companion import MobilerakerCompanion, requests
+
+
+class TestMobilerakerCompanion(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.loop = asyncio.get_running_loop()
+        self.fcm_client = MagicMock()
+        self.companion = MobilerakerCompanion(
+            MagicMock(), MagicMock(), self.fcm_client, MagicMock(), "Printer", self.loop, MagicMock()
+        )
+
+    async def test_push_runs_in_executor(self):
+        push_threads = []
+        self.fcm_client.push.side_effect = lambda request: push_threads.append(threading.get_ident())
+
+        with patch.object(self.loop, "run_in_executor", wraps=self.loop.run_in_executor) as run_in_executor:
+            await self.companion._push_and_clear_faulty([MagicMock()])
+
+        run_in_executor.assert_called_once()
+        self.assertIs(run_in_executor.call_args.args[1], self.fcm_client.push)
+        self.assertEqual(len(push_threads), 1)
+        self.assertNotEqual(push_threads[0], threading.get_ident())
+
+    async def test_push_request_exception_is_logged(self):
+        self.fcm_client.push.side_effect = requests.exceptions.RequestException("backend down")
+
+        with self.assertLogs(self.companion._logger, level="ERROR"):
+            await self.companion._push_and_clear_faulty([MagicMock()])
+
+    async def test_push_skipped_without_requests(self):
+        await self.companion._push_and_clear_faulty([])
+        self.fcm_client.push.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
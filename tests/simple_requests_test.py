@@ -0,0 +1,227 @@
+import json
+import socket
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from mobileraker.util import simple_requests
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status, body, content_type="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.server.peers.append(self.client_address)
+        if self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/echo?redirected=1")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.path == "/missing":
+            self._reply(404, b"not here", "text/plain")
+        elif self.path == "/floats":
+            self._reply(200, b'{"result": [{"v": 1.5}, {"v": 2}]}')
+        elif self.path == "/list":
+            self._reply(200, json.dumps({"result": [{"n": n} for n in range(100)]}).encode("utf-8"))
+        elif self.path == "/close-after":
+            # Looks like a keep-alive reply, but the socket is dropped afterwards.
+            self._reply(200, b"{}")
+            self.close_connection = True
+        elif self.path == "/slow":
+            time.sleep(0.5)
+            self._reply(200, b"{}")
+        elif self.path == "/huge-error":
+            self._reply(500, b"x" * 100000, "text/plain")
+        elif self.path == "/user-agent":
+            self._reply(200, json.dumps({"user_agent": self.headers.get("User-Agent")}).encode("utf-8"))
+        else:
+            self._reply(200, json.dumps({"path": self.path}).encode("utf-8"))
+
+    def do_POST(self):
+        self.server.peers.append(self.client_address)
+        length = int(self.headers.get("Content-Length", 0))
+        payload = self.rfile.read(length)
+        if self.path == "/drop":
+            self.close_connection = True
+            return
+        self._reply(200, json.dumps({
+            "content_type": self.headers.get("Content-Type"),
+            "body": payload.decode("utf-8"),
+        }).encode("utf-8"))
+
+
+class TestSimpleRequests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.peers = []
+        # Clients dropping a connection mid-body is expected in some tests.
+        cls.server.handle_error = lambda request, client_address: None
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        simple_requests.close_all()
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        simple_requests.close_all()
+        self.server.peers.clear()
+
+    def test_get_json(self):
+        res = simple_requests.get(f"{self.base}/echo?a=1", timeout=5)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json(), {"path": "/echo?a=1"})
+        self.assertEqual(res.headers["content-type"], "application/json")
+
+    def test_default_user_agent(self):
+        res = simple_requests.get(f"{self.base}/user-agent", timeout=5)
+        self.assertTrue(res.json()["user_agent"].startswith("Python-urllib/"))
+        res = simple_requests.get(f"{self.base}/user-agent", headers={"User-Agent": "custom"}, timeout=5)
+        self.assertEqual(res.json(), {"user_agent": "custom"})
+
+    def test_post_json(self):
+        res = simple_requests.post(f"{self.base}/update", json={"a": 1}, timeout=5)
+        self.assertEqual(res.json()["content_type"], "application/json")
+        self.assertEqual(json.loads(res.json()["body"]), {"a": 1})
+
+    def test_post_empty_body(self):
+        res = simple_requests.post(f"{self.base}/update", timeout=5)
+        self.assertEqual(res.json(), {"content_type": None, "body": ""})
+
+    def test_post_data_with_headers(self):
+        res = simple_requests.post(
+            f"{self.base}/update", data=b"raw", headers={"Content-Type": "text/plain"}, timeout=5
+        )
+        self.assertEqual(res.json(), {"content_type": "text/plain", "body": "raw"})
+
+    def test_post_buffer_bodies(self):
+        large = b"y" * 100000
+        for body in (memoryview(b"view"), bytearray(b"array"), large):
+            with self.subTest(kind=type(body).__name__):
+                res = simple_requests.post(
+                    f"{self.base}/update", data=body, headers={"Content-Type": "text/plain"}, timeout=5
+                )
+                self.assertEqual(res.json()["body"], bytes(body).decode("utf-8"))
+
+    def test_stream_iter_content(self):
+        res = simple_requests.get(f"{self.base}/list", timeout=5, stream=True)
+        chunks = list(res.iter_content(chunk_size=64))
+        self.assertTrue(all(len(chunk) <= 64 for chunk in chunks))
+        self.assertEqual(len(json.loads(b"".join(chunks))["result"]), 100)
+        with self.assertRaises(RuntimeError):
+            res.content
+
+    def test_stream_json_streaming(self):
+        res = simple_requests.get(f"{self.base}/list", timeout=5, stream=True)
+        self.assertEqual(sum(item["n"] for item in res.json_streaming("result.item")), sum(range(100)))
+
+    def test_stream_json_streaming_with_ijson(self):
+        calls = []
+
+        def items(f, prefix, use_float=False):
+            # Minimal stand-in for ijson: records the call and parses what it reads.
+            calls.append((prefix, use_float))
+            chunks = iter(lambda: f.read(16), b"")
+            yield from simple_requests._iter_json_prefix(json.loads(b"".join(chunks)), prefix.split("."))
+
+        with patch.object(simple_requests, "ijson", SimpleNamespace(items=items)):
+            res = simple_requests.get(f"{self.base}/floats", timeout=5, stream=True)
+            values = [item["v"] for item in res.json_streaming("result.item")]
+        self.assertEqual(values, [1.5, 2])
+        self.assertEqual(calls, [("result.item", True)])
+
+    def test_stream_json_streaming_maps_read_errors(self):
+        raw = MagicMock()
+        raw.read.side_effect = socket.timeout("timed out")
+
+        def items(f, prefix, use_float=False):
+            yield f.read(16)
+
+        res = simple_requests.Response(200, MagicMock(), None, raw=raw)
+        with patch.object(simple_requests, "ijson", SimpleNamespace(items=items)):
+            with self.assertRaises(simple_requests.Timeout):
+                list(res.json_streaming("item"))
+
+    @unittest.skipUnless(simple_requests.ijson, "ijson is not installed")
+    def test_stream_json_streaming_yields_floats(self):
+        res = simple_requests.get(f"{self.base}/floats", timeout=5, stream=True)
+        values = [item["v"] for item in res.json_streaming("result.item")]
+        self.assertEqual(values, [1.5, 2])
+        self.assertIsInstance(values[0], float)
+
+    def test_stream_content_is_read_on_access(self):
+        res = simple_requests.get(f"{self.base}/echo", timeout=5, stream=True)
+        self.assertEqual(res.json(), {"path": "/echo"})
+        self.assertEqual(list(res.iter_content()), [res.content])
+
+    def test_connection_is_reused(self):
+        for _ in range(3):
+            simple_requests.get(f"{self.base}/echo", timeout=5)
+        simple_requests.post(f"{self.base}/update", json={}, timeout=5)
+        self.assertEqual(len(self.server.peers), 4)
+        self.assertEqual(len(set(self.server.peers)), 1)
+
+    def test_stale_pooled_socket_is_retried(self):
+        simple_requests.get(f"{self.base}/close-after", timeout=5)
+        res = simple_requests.get(f"{self.base}/echo", timeout=5)
+        self.assertEqual(res.json(), {"path": "/echo"})
+        self.assertEqual(len(set(self.server.peers)), 2)
+
+    def test_post_on_fresh_connection_is_not_resent(self):
+        with self.assertRaises(simple_requests.exceptions.ConnectionError):
+            simple_requests.post(f"{self.base}/drop", json={"a": 1}, timeout=5)
+        self.assertEqual(len(self.server.peers), 1)
+
+    def test_reconnects_after_close_all(self):
+        simple_requests.get(f"{self.base}/echo", timeout=5)
+        simple_requests.close_all()
+        simple_requests.get(f"{self.base}/echo", timeout=5)
+        self.assertEqual(len(set(self.server.peers)), 2)
+
+    def test_follows_redirect(self):
+        res = simple_requests.get(f"{self.base}/redirect", timeout=5)
+        self.assertEqual(res.json(), {"path": "/echo?redirected=1"})
+
+    def test_error_status_raises(self):
+        with self.assertRaises(simple_requests.HTTPError):
+            simple_requests.get(f"{self.base}/missing", timeout=5)
+
+    def test_large_error_body_is_not_read(self):
+        with self.assertRaises(simple_requests.HTTPError) as ctx:
+            simple_requests.get(f"{self.base}/huge-error", timeout=5)
+        self.assertLess(len(str(ctx.exception)), 600)
+        # The unread remainder forces a fresh connection for the next call.
+        simple_requests.get(f"{self.base}/echo", timeout=5)
+        self.assertEqual(len(set(self.server.peers)), 2)
+
+    def test_timeout(self):
+        with self.assertRaises(simple_requests.Timeout) as ctx:
+            simple_requests.get(f"{self.base}/slow", timeout=0.1)
+        self.assertTrue(ctx.exception.__suppress_context__)
+        self.assertEqual(len(ctx.exception.args), 1)
+
+    def test_connection_refused(self):
+        with self.assertRaises(simple_requests.exceptions.ConnectionError):
+            simple_requests.get("http://127.0.0.1:1/", timeout=5)
+
+
+if __name__ == '__main__':
+    unittest.main()